@@ -43,4 +43,39 @@ def transcribe_int16_wav(model, int16_bytes: bytes, samplerate: int) -> str:
     # Read result and extract text content (transcription)
     result = json.loads(recognizer.FinalResult())
 
-    return result.get('text', '').strip()
\ No newline at end of file
+    return result.get('text', '').strip()
+
+def stream_int16_results(model, blocks, samplerate: int):
+    '''
+    Feed 16 bit audio bytes into Vosk recognizer as they arrive and yield results as soon as they are produced.
+
+    blocks:
+        iterable of (int16_bytes, arrival_time)
+
+    Yields:
+        (kind, result dict, arrival time of the last block), kind is 'partial', 'result' or 'final'
+    '''
+    recognizer = KaldiRecognizer(model, samplerate)
+    last_partial = ''
+    arrival = None
+
+    for int16_bytes, arrival in blocks:
+        # Empty block (e.g. end of stream marker) only updates arrival time used for the final result
+        if not int16_bytes:
+            continue
+
+        # Recognizer detected end of utterance
+        if recognizer.AcceptWaveform(int16_bytes):
+            last_partial = ''
+            yield 'result', json.loads(recognizer.Result()), arrival
+            continue
+
+        # Only report partial result when it changed
+        partial = json.loads(recognizer.PartialResult())
+        text = partial.get('partial', '')
+        if text and text != last_partial:
+            last_partial = text
+            yield 'partial', partial, arrival
+
+    # Flush the rest of the audio
+    yield 'final', json.loads(recognizer.FinalResult()), arrival
@@ -10,9 +10,10 @@ def load_audio(file_path: str) -> tuple[np.ndarray, int]:
         - audio - np.ndarray - either mono (N, ) or multi-channel (N, C);
         - samplerate - int - sample rate.
     '''
-    audio, samplerate = sf.read(file_path, always_2d=False)
+    # Read straight into float32 (soundfile defaults to float64, which we would only cast down later)
+    audio, samplerate = sf.read(file_path, dtype='float32', always_2d=False)
 
-    # Convert to float32 for uniform data and smoother processing next
+    # Make sure we have float32 for uniform data and smoother processing next
     audio = np.asarray(audio, dtype=np.float32)
 
     return audio, samplerate
@@ -99,4 +100,70 @@ def to_int16_wav_bytes(audio: np.ndarray) -> bytes:
     # Convert float32 to int16
     int16 = (audio * 32767.0).astype(np.int16)
 
-    return int16.tobytes()
\ No newline at end of file
+    return int16.tobytes()
+
+
+# PCM subtypes that soundfile can read losslessly as int16 (no need for float read)
+_INT16_SUBTYPES = {'PCM_16', 'PCM_S8', 'PCM_U8'}
+
+
+def probe_audio(file_path: str) -> tuple[int, int, str]:
+    '''
+    Inspect audio file header without decoding samples.
+
+    Returns:
+        - samplerate - int - sample rate;
+        - channels - int - number of channels;
+        - subtype - str - soundfile subtype (e.g. 'PCM_16', 'FLOAT').
+    '''
+    info = sf.info(file_path)
+
+    return info.samplerate, info.channels, info.subtype
+
+
+def load_int16_wav_bytes(file_path: str, target_sr: int, normalize: bool = True) -> tuple[bytes, int]:
+    '''
+    Format-aware alternative to preprocess_audio() + to_int16_wav_bytes().
+    Checks the file header first:
+    - 16 bit mono file at target samplerate and no normalization -> raw int16 frames are returned as is;
+    - otherwise read with the narrowest dtype (int16 for 8/16 bit PCM, float32 for the rest)
+      and do mixdown, resample, peak normalization and int16 quantization in a single pass.
+
+    Returns:
+        int16 audio bytes, sample_rate (target_sr)
+    '''
+    samplerate, channels, subtype = probe_audio(file_path)
+    is_int16 = subtype in _INT16_SUBTYPES
+
+    # Fast path - file already has required format, skip float conversion altogether
+    if subtype == 'PCM_16' and channels == 1 and samplerate == target_sr and not normalize:
+        with sf.SoundFile(file_path) as f:
+            return bytes(f.buffer_read(dtype='int16')), target_sr
+
+    # Read with the narrowest dtype
+    audio, samplerate = sf.read(file_path, dtype='int16' if is_int16 else 'float32', always_2d=False)
+
+    # Full scale of the read data: int16 samples are kept unscaled until quantization
+    full_scale = 32768.0 if is_int16 else 1.0
+
+    # Mixdown to mono (float32 accumulator so int16 channels do not overflow)
+    if audio.ndim == 1:
+        mono = audio.astype(np.float32)
+    else:
+        mono = np.mean(audio, axis=1, dtype=np.float32)
+
+    # Resample
+    resampled = _resample_linear(mono, samplerate, target_sr)
+
+    # Fold input scaling, optional peak normalization and int16 scaling into one gain
+    if normalize:
+        peak = float(np.max(np.abs(resampled), initial=0.0)) / full_scale + 1e-9
+        gain = 0.99 / peak / full_scale * 32767.0
+    else:
+        gain = 32767.0 / full_scale
+
+    # Apply gain and limit amplitude in place, then quantize
+    resampled *= gain
+    np.clip(resampled, -32767.0, 32767.0, out=resampled)
+
+    return resampled.astype(np.int16).tobytes(), target_sr
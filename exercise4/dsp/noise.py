@@ -2,19 +2,14 @@ import numpy as np
 from scipy.signal import butter, lfilter
 
 
-def _apply_bandpass_filter(
-    audio: np.ndarray,
+def _bandpass_coeffs(
     freq: int,
     lowcut: float = 100.0,
     highcut: float = 7500.0,
     order: int = 4
-) -> np.ndarray:
+) -> tuple[np.ndarray, np.ndarray]:
     '''
-    Butterworth band-pass filter.
-
-    It should keep most speech energy and reduce:
-    - very low frequencies: mic rumble, wind, mic handling noise
-    - very high frequencies: hiss and some background noise
+    Butterworth band-pass transfer function coefficients (b, a) for the given samplerate.
     '''
     # Calculate low-high range based on maximal available(Nyquist) frequency and low-/high- cut frequencies
     nyq_freq = 0.5 * freq
@@ -26,7 +21,24 @@ def _apply_bandpass_filter(
     high = max(min(high, 0.99), low + 1e-5)
 
     # Butterworth transfer functions
-    b, a = butter(order, [low, high], btype='band')
+    return butter(order, [low, high], btype='band')
+
+
+def _apply_bandpass_filter(
+    audio: np.ndarray,
+    freq: int,
+    lowcut: float = 100.0,
+    highcut: float = 7500.0,
+    order: int = 4
+) -> np.ndarray:
+    '''
+    Butterworth band-pass filter.
+
+    It should keep most speech energy and reduce:
+    - very low frequencies: mic rumble, wind, mic handling noise
+    - very high frequencies: hiss and some background noise
+    '''
+    b, a = _bandpass_coeffs(freq, lowcut=lowcut, highcut=highcut, order=order)
 
     # Apply them and return filtered audio
     filtered_audio = lfilter(b, a, audio).astype(np.float32)
@@ -0,0 +1,285 @@
+import time
+import queue
+import struct
+import threading
+import numpy as np
+from scipy.signal import lfilter
+from dsp.audio import to_int16_wav_bytes
+from dsp.noise import _bandpass_coeffs
+
+
+def iter_pcm_blocks(
+    f,
+    channels: int,
+    block_frames: int,
+    *,
+    follow: bool = False,
+    poll_s: float = 0.05,
+    idle_timeout_s: float = 5.0,
+    max_bytes: int | None = None,
+):
+    '''
+    Read raw 16 bit little-endian PCM from a binary file object as it arrives.
+    Uses read1() so whatever is available is returned immediately (no waiting for a full block).
+
+    follow:
+        keep polling at EOF (file still being written) until no new data for idle_timeout_s
+    max_bytes:
+        stop after this many bytes (known WAV data size), None - read until EOF
+
+    Yields:
+        frames (int16 (N, C)), arrival time (time.monotonic());
+        last item is an empty block stamped with the time end of stream was detected
+    '''
+    frame_bytes = 2 * channels
+    block_bytes = block_frames * frame_bytes
+    remaining = max_bytes
+    pending = b''
+    last_data = time.monotonic()
+
+    while True:
+        # Known data size fully read
+        if remaining is not None and remaining <= 0:
+            now = time.monotonic()
+            break
+
+        data = f.read1(block_bytes if remaining is None else min(block_bytes, remaining))
+        now = time.monotonic()
+
+        # EOF: either stop or wait for more data
+        if not data:
+            if not follow or now - last_data > idle_timeout_s:
+                break
+            time.sleep(poll_s)
+            continue
+
+        last_data = now
+        if remaining is not None:
+            remaining -= len(data)
+        pending += data
+
+        # Only pass whole frames, keep the rest for the next read
+        usable = len(pending) - len(pending) % frame_bytes
+        if usable:
+            frames = np.frombuffer(pending[:usable], dtype='<i2').reshape(-1, channels)
+            pending = pending[usable:]
+            yield frames, now
+
+    # End of stream marker, so final result latency is measured from EOF (not from the last data block)
+    yield np.zeros((0, channels), dtype=np.int16), now
+
+
+def threaded_blocks(blocks):
+    '''
+    Run block reader on a separate thread and pass blocks through a queue.
+    Source is read (and arrival time stamped) as soon as data is available, even while
+    the consumer is still decoding previous blocks, so decoding backlog shows up in latency.
+    '''
+    q = queue.Queue()
+    done = object()
+
+    def reader():
+        try:
+            for item in blocks:
+                q.put(item)
+        except Exception as err:
+            q.put(err)
+        q.put(done)
+
+    threading.Thread(target=reader, daemon=True).start()
+
+    while True:
+        item = q.get()
+
+        if item is done:
+            break
+
+        # Re-raise reader errors in the consumer thread
+        if isinstance(item, Exception):
+            raise item
+
+        yield item
+
+
+# Data chunk size values written by recorders before the file is finalised
+_WAV_SIZE_UNKNOWN = (0, 0xFFFFFFFF)
+
+
+def _parse_wav_header(header: bytes) -> tuple[int, int, int, int | None] | None:
+    '''
+    Parse RIFF/WAVE header of a (possibly still growing) file.
+    Recorders often leave data size as 0 (or 0xFFFFFFFF) until the file is closed, it is reported as None then.
+
+    Returns:
+        (samplerate, channels, data offset, data size) or None if header is not complete yet
+    '''
+    # Header guard clause
+    if len(header) < 12:
+        return None
+    if header[0:4] != b'RIFF' or header[8:12] != b'WAVE':
+        raise ValueError('Not a RIFF/WAVE file')
+
+    fmt = None
+    pos = 12
+
+    # Walk over chunks until data chunk
+    while pos + 8 <= len(header):
+        chunk_id = header[pos:pos + 4]
+        chunk_size = struct.unpack('<I', header[pos + 4:pos + 8])[0]
+
+        if chunk_id == b'data':
+            # Data can not start before fmt chunk is known
+            if fmt is None:
+                raise ValueError('WAV data chunk found before fmt chunk')
+            data_size = None if chunk_size in _WAV_SIZE_UNKNOWN else chunk_size
+            return fmt[0], fmt[1], pos + 8, data_size
+
+        if chunk_id == b'fmt ':
+            # Wait for full fmt chunk
+            if pos + 8 + 16 > len(header):
+                return None
+
+            tag, channels, samplerate, _, _, bits = struct.unpack('<HHIIHH', header[pos + 8:pos + 24])
+
+            # Only 16 bit PCM (or extensible) can be tailed
+            if tag not in (1, 0xFFFE) or bits != 16:
+                raise ValueError(f'Only 16 bit PCM WAV can be streamed (format tag {tag}, {bits} bits)')
+
+            fmt = (samplerate, channels)
+
+        # Chunks are word aligned
+        pos += 8 + chunk_size + (chunk_size & 1)
+
+    return None
+
+
+def tail_wav_blocks(
+    wav_path: str,
+    block_ms: float = 100.0,
+    *,
+    poll_s: float = 0.05,
+    idle_timeout_s: float = 5.0,
+):
+    '''
+    Follow a 16 bit PCM WAV file that is still being written (similar to `tail -f`).
+    Stops after data chunk size bytes if header has it, otherwise when file did not grow for idle_timeout_s.
+
+    Returns:
+        samplerate, channels, generator of (frames (int16 (N, C)), arrival time)
+    '''
+    start = time.monotonic()
+
+    # Wait until header is written
+    with open(wav_path, 'rb') as f:
+        while True:
+            parsed = _parse_wav_header(f.read(64 * 1024))
+
+            if parsed is not None:
+                break
+
+            # Guard clause - file never got a usable header
+            if time.monotonic() - start > idle_timeout_s:
+                raise ValueError(f'No complete WAV header in `{wav_path}`')
+
+            f.seek(0)
+            time.sleep(poll_s)
+
+    samplerate, channels, data_offset, data_size = parsed
+    block_frames = max(int(samplerate * block_ms / 1000.0), 1)
+
+    # File is opened only when the generator is iterated, so an unused generator does not hold a handle
+    def blocks():
+        with open(wav_path, 'rb') as f:
+            f.seek(data_offset)
+            yield from iter_pcm_blocks(
+                f,
+                channels,
+                block_frames,
+                follow=True,
+                poll_s=poll_s,
+                idle_timeout_s=idle_timeout_s,
+                max_bytes=data_size,
+            )
+
+    return samplerate, channels, blocks()
+
+
+class StreamPreprocessor:
+    '''
+    Block-wise version of the preprocess pipeline for streaming: mono mixdown, resample, optional bandpass.
+    Resampler and filter keep their state between blocks, so block borders do not add clicks.
+    Peak normalization and noise gate need the whole file, so they are not applied here.
+    '''
+
+    def __init__(self, samplerate: int, target_sr: int, use_bandpass: bool = False):
+        self.samplerate = samplerate
+        self.target_sr = target_sr
+        self.use_bandpass = use_bandpass
+
+        # Number of output samples produced so far
+        self.samples_out = 0
+
+        # Linear resampler state: previous input sample and next output position relative to it
+        self._step = samplerate / float(target_sr)
+        self._prev = None
+        self._pos = 0.0
+
+        # Bandpass filter state
+        if use_bandpass:
+            self._b, self._a = _bandpass_coeffs(target_sr)
+            self._zi = np.zeros(max(len(self._a), len(self._b)) - 1)
+
+    @property
+    def audio_seconds(self) -> float:
+        '''
+        Duration of audio processed so far.
+        '''
+        return self.samples_out / float(self.target_sr)
+
+    def _resample(self, mono: np.ndarray) -> np.ndarray:
+        '''
+        Streaming linear interpolation that continues from previous block.
+        '''
+        # Prepend last sample of previous block so interpolation spans block border
+        x = mono if self._prev is None else np.concatenate(([self._prev], mono))
+        last = len(x) - 1
+
+        # Not enough samples to interpolate yet
+        if last < 0 or self._pos > last:
+            if len(x):
+                self._pos -= last
+                self._prev = x[-1]
+            return np.zeros(0, dtype=np.float32)
+
+        positions = np.arange(self._pos, last + 1e-9, self._step)
+        y = np.interp(positions, np.arange(len(x)), x).astype(np.float32)
+
+        # Next output position relative to the new "previous" sample (x[-1])
+        self._pos = positions[-1] + self._step - last
+        self._prev = x[-1]
+
+        return y
+
+    def process(self, frames: np.ndarray) -> bytes:
+        '''
+        Turn one block of int16 frames (N, C) into int16 mono bytes at target samplerate.
+        '''
+        # Fast path - nothing to transform
+        if frames.shape[1] == 1 and self.samplerate == self.target_sr and not self.use_bandpass:
+            self.samples_out += len(frames)
+            return frames.tobytes()
+
+        # Mixdown to mono float32
+        mono = np.mean(frames, axis=1, dtype=np.float32) / np.float32(32768.0)
+
+        # Resample (skip if already required samplerate)
+        if self.samplerate != self.target_sr:
+            mono = self._resample(mono)
+
+        # Optional bandpass with carried filter state
+        if self.use_bandpass and len(mono):
+            mono, self._zi = lfilter(self._b, self._a, mono, zi=self._zi)
+
+        self.samples_out += len(mono)
+
+        return to_int16_wav_bytes(mono)
@@ -0,0 +1,236 @@
+import os
+import csv
+import argparse
+import numpy as np
+import soundfile as sf
+from config import ASSETS_DIR, LANG_FOLDERS, VOSK_SR, TRANSCRIPT_CSV_PATH
+from dsp.audio import load_audio, ensure_mono, _resample_linear
+from eval.manifest import load_transcriptions
+
+
+# Output sample rates / channel counts to vary the format of generated files
+SYNTH_SAMPLERATES = (8000, 16000, 22050, 44100, 48000)
+SYNTH_CHANNELS = (1, 2)
+
+# Manifest columns: first three are the same as transcriptions.csv, so load_transcriptions() can read it
+MANIFEST_FIELDS = ['language', 'file_name', 'transcript', 'duration_s', 'samplerate', 'channels', 'snr_db', 'sources']
+
+
+def load_source_clips(
+    csv_path: str = TRANSCRIPT_CSV_PATH,
+    assets_dir: str = ASSETS_DIR,
+    base_sr: int = VOSK_SR,
+) -> dict[str, list[tuple[str, np.ndarray, str]]]:
+    '''
+    Load every asset wav that has a transcription row as mono float32 at base samplerate.
+    Rows without wav file (e.g. *_child.wav) are skipped.
+
+    Returns:
+        dict keyed by language -> list of (file_name, audio, transcript)
+    '''
+    references = load_transcriptions(csv_path)
+    clips: dict[str, list[tuple[str, np.ndarray, str]]] = {}
+
+    for (lang, file_name), transcript in sorted(references.items()):
+        # Skip languages without assets folder mapping
+        if lang not in LANG_FOLDERS:
+            continue
+
+        wav_path = os.path.join(assets_dir, LANG_FOLDERS[lang], file_name)
+
+        # Skip transcripts that have no wav
+        if not os.path.isfile(wav_path):
+            continue
+
+        audio, samplerate = load_audio(wav_path)
+        mono = _resample_linear(ensure_mono(audio), samplerate, base_sr)
+        clips.setdefault(lang, []).append((file_name, mono, transcript))
+
+    # Guard clause
+    if not clips:
+        raise FileNotFoundError(f'No transcribed WAV files found in: {assets_dir}')
+
+    return clips
+
+
+def _speed_perturb(audio: np.ndarray, samplerate: int, factor: float) -> np.ndarray:
+    '''
+    Time-stretch clip by factor (>1 faster/shorter, <1 slower/longer) with linear interpolation.
+    Pitch changes together with tempo, same as the usual ASR speed perturbation.
+    '''
+    # Treat clip as recorded at factor * samplerate and resample back to samplerate
+    return _resample_linear(audio, int(round(samplerate * factor)), samplerate)
+
+
+def _add_noise(audio: np.ndarray, snr_db: float, rng: np.random.Generator) -> np.ndarray:
+    '''
+    Add white gaussian noise at requested signal-to-noise ratio (dB).
+    '''
+    signal_power = float(np.mean(audio ** 2)) + 1e-12
+    noise_power = signal_power / (10 ** (snr_db / 10.0))
+    noise = rng.standard_normal(len(audio), dtype=np.float32) * np.float32(np.sqrt(noise_power))
+
+    return audio + noise
+
+
+def synthesize_item(
+    clips: list[tuple[str, np.ndarray, str]],
+    rng: np.random.Generator,
+    *,
+    base_sr: int = VOSK_SR,
+    max_concat: int = 8,
+    speed_range: tuple[float, float] = (0.9, 1.1),
+    snr_range: tuple[float, float] = (5.0, 30.0),
+    gap_range: tuple[float, float] = (0.2, 0.8),
+) -> tuple[np.ndarray, int, dict]:
+    '''
+    Build one long-form synthetic sample:
+    1) Pick 1..max_concat random clips of one language;
+    2) Speed perturb each clip and concatenate them with short silence gaps;
+    3) Add noise at random SNR;
+    4) Resample to random output samplerate and optionally duplicate to stereo.
+
+    Returns:
+        audio ((N, ) or (N, C) float32), samplerate, manifest metadata dict
+    '''
+    n_parts = int(rng.integers(1, max_concat + 1))
+    picks = rng.integers(0, len(clips), size=n_parts)
+    factors = rng.uniform(*speed_range, size=n_parts)
+    gaps = (rng.uniform(*gap_range, size=n_parts) * base_sr).astype(np.int64)
+
+    parts = []
+    transcripts = []
+    sources = []
+
+    for idx, factor, gap in zip(picks, factors, gaps):
+        file_name, audio, transcript = clips[idx]
+        parts.append(_speed_perturb(audio, base_sr, float(factor)))
+        parts.append(np.zeros(gap, dtype=np.float32))
+        transcripts.append(transcript)
+        sources.append(file_name)
+
+    # Concatenate all parts in one go (trailing gap is kept as tail silence)
+    audio = np.concatenate(parts)
+
+    # Additive noise
+    snr_db = float(rng.uniform(*snr_range))
+    audio = _add_noise(audio, snr_db, rng)
+
+    # Sample rate variation
+    samplerate = int(rng.choice(SYNTH_SAMPLERATES))
+    audio = _resample_linear(audio, base_sr, samplerate)
+
+    # Keep amplitude in range, so PCM16 write does not clip
+    peak = float(np.max(np.abs(audio)))
+    if peak > 0.99:
+        audio *= np.float32(0.99 / peak)
+
+    # Channel variation: second channel is slightly attenuated copy
+    channels = int(rng.choice(SYNTH_CHANNELS))
+    if channels == 2:
+        audio = np.stack([audio, audio * np.float32(rng.uniform(0.7, 1.0))], axis=1)
+
+    meta = {
+        'transcript': ' '.join(transcripts),
+        'duration_s': f'{len(audio) / float(samplerate):.3f}',
+        'samplerate': samplerate,
+        'channels': channels,
+        'snr_db': f'{snr_db:.1f}',
+        'sources': ';'.join(sources),
+    }
+
+    return audio, samplerate, meta
+
+
+def generate_corpus(
+    out_dir: str,
+    *,
+    hours: float = 1.0,
+    seed: int = 0,
+    langs: list[str] | None = None,
+    max_concat: int = 8,
+    csv_path: str = TRANSCRIPT_CSV_PATH,
+    assets_dir: str = ASSETS_DIR,
+) -> str:
+    '''
+    Generate reproducible synthetic corpus from the source clips until total duration reaches `hours`.
+    Source is csv_path/assets_dir (exercise 4 assets by default), so a generated corpus can be a source too.
+    Layout matches assets dir (<out_dir>/<LANG_FOLDER>/*.wav) so it can be passed as `assets_dir`,
+    and manifest is written to <out_dir>/transcriptions.csv.
+
+    Every file gets its own generator seeded with (seed, index), so any file can be regenerated alone.
+
+    Returns:
+        path to the manifest file
+    '''
+    clips = load_source_clips(csv_path=csv_path, assets_dir=assets_dir)
+    langs = sorted(clips.keys()) if langs is None else [lang for lang in langs if lang in clips]
+
+    # Guard clause
+    if not langs:
+        raise ValueError(f'No source clips for requested languages. Available: {sorted(clips.keys())}')
+
+    for lang in langs:
+        os.makedirs(os.path.join(out_dir, LANG_FOLDERS[lang]), exist_ok=True)
+
+    target_sec = hours * 3600.0
+    total_sec = 0.0
+    rows = []
+    index = 0
+
+    while total_sec < target_sec:
+        rng = np.random.default_rng([seed, index])
+
+        # Round-robin over languages keeps corpus balanced
+        lang = langs[index % len(langs)]
+        audio, samplerate, meta = synthesize_item(clips[lang], rng, max_concat=max_concat)
+
+        file_name = f'synth_{index:07d}.wav'
+        sf.write(os.path.join(out_dir, LANG_FOLDERS[lang], file_name), audio, samplerate, subtype='PCM_16')
+
+        rows.append({'language': lang, 'file_name': file_name, **meta})
+        total_sec += len(audio) / float(samplerate)
+        index += 1
+
+    # Write manifest in one go
+    manifest_path = os.path.join(out_dir, 'transcriptions.csv')
+    with open(manifest_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=MANIFEST_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print(f'Generated {index} files, {total_sec / 3600.0:.2f} h total -> {out_dir}')
+
+    return manifest_path
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Synthetic load corpus generator (from exercise 4 assets)')
+
+    parser.add_argument('out_dir', help='Output folder for generated wavs and manifest')
+    parser.add_argument('--hours', type=float, default=1.0, help='Total audio duration to generate, hours')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (same seed -> same corpus)')
+    parser.add_argument(
+        '--langs',
+        nargs='+',
+        default=None,
+        help=f'Languages to generate (choices: {list(LANG_FOLDERS.keys())}, default: all with assets)',
+    )
+    parser.add_argument('--maxConcat', type=int, default=8, help='Maximum number of clips concatenated per file')
+    parser.add_argument('--sourceCsv', default=TRANSCRIPT_CSV_PATH, help='Transcriptions CSV of the source clips')
+    parser.add_argument('--sourceDir', default=ASSETS_DIR, help='Assets folder of the source clips (<dir>/<LANG_FOLDER>/*.wav)')
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    generate_corpus(
+        args.out_dir,
+        hours=args.hours,
+        seed=args.seed,
+        langs=args.langs,
+        max_concat=args.maxConcat,
+        csv_path=args.sourceCsv,
+        assets_dir=args.sourceDir,
+    )
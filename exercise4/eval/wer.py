@@ -4,6 +4,7 @@ from config import ASSETS_DIR, LANG_FOLDERS, VOSK_SR
 import os
 from pipeline import transcribe_wav_path
 from collections import defaultdict
+from functools import lru_cache
 
 
 # Setup jiwer to normalize texts by lovercasing, trmming, removing punctuation and slitting text into word tokens.
@@ -28,16 +29,32 @@ class WERResult:
     wer: float
 
 
-def wer_details(reference_text: str = '', hypothesis_text: str = '') -> WERResult:
+# Tokens are already normalized by DEFAULT_TRANSFORM, only split them back into words
+_TOKENS_TRANSFORM = jiwer.ReduceToListOfListOfWords()
+
+# Cache sizes: references repeat a lot (same sentence for many files/configs), hypotheses less so
+NORMALIZE_CACHE_SIZE = 65536
+ALIGN_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_text(text: str) -> tuple[str, ...]:
     '''
-    Simple wrapper around jiwer to calculate WER between ASR output (hypotheises) and original transcript (reference)
+    Memoized DEFAULT_TRANSFORM: lowercase, strip punctuation/spaces and split into word tokens.
+    '''
+    return tuple(DEFAULT_TRANSFORM(text)[0])
+
+
+@lru_cache(maxsize=ALIGN_CACHE_SIZE)
+def _align_tokens(ref_tokens: tuple[str, ...], hyp_tokens: tuple[str, ...]) -> WERResult:
+    '''
+    Align normalized tokens with jiwer and count errors. Cached, so each distinct (ref, hyp) pair is scored once.
     '''
-    # Calculate word error rate between 2 strings
     res = jiwer.process_words(
-        reference_text, 
-        hypothesis_text,
-        reference_transform=DEFAULT_TRANSFORM,
-        hypothesis_transform=DEFAULT_TRANSFORM,
+        ' '.join(ref_tokens),
+        ' '.join(hyp_tokens),
+        reference_transform=_TOKENS_TRANSFORM,
+        hypothesis_transform=_TOKENS_TRANSFORM,
     )
 
     # JIWER returns detailed information as: hits/subs/dels/ins
@@ -49,6 +66,44 @@ def wer_details(reference_text: str = '', hypothesis_text: str = '') -> WERResul
     return WERResult(S=S, D=D, I=I, N=N, wer=res.wer)
 
 
+def wer_details(reference_text: str = '', hypothesis_text: str = '') -> WERResult:
+    '''
+    Simple wrapper around jiwer to calculate WER between ASR output (hypotheises) and original transcript (reference)
+    Both texts are normalized and aligned through caches (see wer_cache_stats()).
+    '''
+    res = _align_tokens(normalize_text(reference_text), normalize_text(hypothesis_text))
+
+    # Return a copy, so callers can not modify cached result
+    return WERResult(S=res.S, D=res.D, I=res.I, N=res.N, wer=res.wer)
+
+
+def wer_cache_stats() -> dict[str, dict]:
+    '''
+    Hit/miss statistics of normalization and alignment caches.
+    '''
+    stats = {}
+
+    for name, fn in (('normalize', normalize_text), ('align', _align_tokens)):
+        info = fn.cache_info()
+        total = info.hits + info.misses
+        stats[name] = {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'hit_rate': info.hits / total if total else 0.0,
+        }
+
+    return stats
+
+
+def clear_wer_cache() -> None:
+    '''
+    Reset normalization and alignment caches (and their statistics).
+    '''
+    normalize_text.cache_clear()
+    _align_tokens.cache_clear()
+
+
 # Transcript key in form of (language, filename)
 Transcript_Key = tuple[str, str]
 
@@ -109,6 +164,7 @@ def build_hypotheses_from_assets_vosk(
     assets_dir: str = ASSETS_DIR,
     target_sr: int = VOSK_SR,
     use_denoise: bool = True,
+    normalize: bool = True,
 ) -> dict[Transcript_Key, str]:
     '''
     Build hypotheses dict by scanning lang assets dir and transcribing all wavs inside.
@@ -148,6 +204,7 @@ def build_hypotheses_from_assets_vosk(
                 model,
                 target_sr=target_sr,
                 use_denoise=use_denoise,
+                normalize=normalize,
             ) or ''
 
             hypotheses[key] = hypothesis.strip()
@@ -1,4 +1,4 @@
-from config import ASSETS_DIR, MODELS_DIR, TRANSCRIPT_CSV_PATH, LANG_FOLDERS
+from config import ASSETS_DIR, MODELS_DIR, TRANSCRIPT_CSV_PATH, LANG_FOLDERS, VOSK_SR
 from asr.vosk_asr import load_model
 from eval.manifest import load_transcriptions
 from eval.wer import (
@@ -7,10 +7,16 @@ from eval.wer import (
     aggregate_corpus,
     aggregate_by_lang,
     print_sample_debug,
+    wer_cache_stats,
 )
 import argparse
+import json
+import sys
+import numpy as np
 import vosk
 from dsp.utils import write_results_table
+from dsp.stream import iter_pcm_blocks, tail_wav_blocks
+from pipeline import transcribe_stream
 
 
 def parse_args():
@@ -31,6 +37,13 @@ def parse_args():
         help='Enable denoise pipeline (bandpass + noise gate)',
     )
 
+    # Toggle peak normalization (without it and denoise, 16 kHz mono PCM16 files skip processing)
+    parser.add_argument(
+        '--noNormalize',
+        action='store_true',
+        help='Skip peak normalization (16 kHz mono 16 bit files are then passed to ASR as is)',
+    )
+
     # Toggle extended log
     parser.add_argument(
         '--debugASR',
@@ -52,9 +65,77 @@ def parse_args():
         help='Skip creating output report file with WER table',
     )
 
+    # Live streaming mode
+    parser.add_argument(
+        '--stream',
+        metavar='SOURCE',
+        default=None,
+        help='Stream mode: transcribe raw 16 bit PCM from stdin (`-`) or follow a WAV file that is still being written. '
+             'Prints JSON lines with partial/final results (first of --langs is used)',
+    )
+
+    # Raw PCM format for stdin streaming
+    parser.add_argument(
+        '--streamRate',
+        type=int,
+        default=VOSK_SR,
+        help='Sample rate of raw PCM on stdin, Hz',
+    )
+
+    parser.add_argument(
+        '--streamChannels',
+        type=int,
+        default=1,
+        help='Number of channels of raw PCM on stdin',
+    )
+
+    # Stop following WAV file after no growth
+    parser.add_argument(
+        '--idleTimeout',
+        type=float,
+        default=5.0,
+        help='Stop following streamed WAV file after this many seconds without new data',
+    )
+
     return parser.parse_args()
 
 
+def run_stream(args, lang: str) -> None:
+    '''
+    Stream mode: feed audio to Vosk as it arrives and print results as JSON lines (stdout).
+    Latency summary goes to stderr so stdout stays machine readable.
+    '''
+    # Load model first, so audio arriving meanwhile is not counted as latency
+    model = load_model(lang)
+    latencies = []
+
+    # Block size for reading, 100 ms
+    block_ms = 100.0
+
+    # Pick audio source
+    if args.stream == '-':
+        samplerate = args.streamRate
+        block_frames = max(int(samplerate * block_ms / 1000.0), 1)
+        blocks = iter_pcm_blocks(sys.stdin.buffer, args.streamChannels, block_frames)
+    else:
+        samplerate, _, blocks = tail_wav_blocks(args.stream, block_ms, idle_timeout_s=args.idleTimeout)
+
+    for event in transcribe_stream(blocks, model, samplerate=samplerate, target_sr=VOSK_SR, use_denoise=args.useDenoise):
+        print(json.dumps(event, ensure_ascii=False), flush=True)
+
+        if event['latency_ms'] is not None:
+            latencies.append(event['latency_ms'])
+
+    # Latency summary
+    if latencies:
+        lat = np.asarray(latencies)
+        print(
+            f'Latency (audio arrival -> text), ms: n={len(lat)} mean={lat.mean():.1f} '
+            f'p50={np.percentile(lat, 50):.1f} p95={np.percentile(lat, 95):.1f} max={lat.max():.1f}',
+            file=sys.stderr,
+        )
+
+
 def main():
     args = parse_args()
 
@@ -69,11 +150,17 @@ def main():
     if invalid:
         raise ValueError(f'Unknown languages: {invalid}. Allowed: {list(LANG_FOLDERS.keys())}')
 
+    # Stream mode skips corpus evaluation
+    if args.stream is not None:
+        run_stream(args, langs[0])
+        return
+
     print('=== Exercise 4 checks ===')
     print(f'Assets folder: {ASSETS_DIR}')
     print(f'Models folder: {MODELS_DIR}')
     print(f'Languages: {langs}')
     print(f'Denoise usage: {args.useDenoise}')
+    print(f'Peak normalization: {not args.noNormalize}')
     print(f'Log ASR per sample: {args.debugASR}')
     print(f'Log VoskApi messages: {args.debugVosk}')
     print(f'Skip output report: {args.noOutput}')
@@ -85,7 +172,11 @@ def main():
     models = {lang: load_model(lang) for lang in langs}
 
     # Build hypotheses dict by running ASR over assets
-    hypotheses = build_hypotheses_from_assets_vosk(models, use_denoise=args.useDenoise)
+    hypotheses = build_hypotheses_from_assets_vosk(
+        models,
+        use_denoise=args.useDenoise,
+        normalize=not args.noNormalize,
+    )
 
     # Compare ASR output to transcriptions
     rows = evaluate_transcriptions(hypotheses, references)
@@ -111,6 +202,10 @@ def main():
         print(f"{lang.upper()} WER: {s['wer']:.4f}  (S={s['S']}, D={s['D']}, I={s['I']}, N={s['N']})")
 
     print(f'\nScored samples: {len(rows)}')
+
+    # WER cache efficiency (repeated references / duplicate ref-hyp pairs)
+    for name, c in wer_cache_stats().items():
+        print(f"WER {name} cache: hits={c['hits']}, misses={c['misses']}, hit rate={c['hit_rate'] * 100:.1f}%")
     print('Done.')
 
 
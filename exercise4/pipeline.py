@@ -1,6 +1,8 @@
-from dsp.audio import preprocess_audio, to_int16_wav_bytes
+import time
+from dsp.audio import preprocess_audio, to_int16_wav_bytes, load_int16_wav_bytes
 from dsp.noise import denoise_pipeline
-from asr.vosk_asr import transcribe_int16_wav
+from dsp.stream import StreamPreprocessor, threaded_blocks
+from asr.vosk_asr import transcribe_int16_wav, stream_int16_results
 
 
 def transcribe_wav_path(
@@ -9,18 +11,60 @@ def transcribe_wav_path(
     *,
     target_sr: int,
     use_denoise: bool = True,
+    normalize: bool = True,
 ) -> str:
     '''
     Full processing pipeline for a single wav file:
     preprocess -> optional denoise -> int16 bytes -> Vosk transcribe
-    '''
-    audio, samplerate = preprocess_audio(wav_path, target_sr=target_sr, normalize=True)
 
-    # Optional noise processing
+    Without denoise there is no float processing step, so the format-aware loader
+    produces int16 bytes directly (raw frames if file already matches the target format).
+    '''
+    # Denoise works on float audio, so use full float preprocess
     if use_denoise:
+        audio, samplerate = preprocess_audio(wav_path, target_sr=target_sr, normalize=normalize)
         audio = denoise_pipeline(audio, freq=samplerate, use_bandpass=True, use_gate=True)
 
-    # Cast to bytes and pass to the ASR
-    int16_bytes = to_int16_wav_bytes(audio)
+        # Cast to bytes
+        int16_bytes = to_int16_wav_bytes(audio)
+    else:
+        int16_bytes, samplerate = load_int16_wav_bytes(wav_path, target_sr=target_sr, normalize=normalize)
+
+    # Pass bytes to the ASR
+    return transcribe_int16_wav(model, int16_bytes, samplerate)
+
+
+def transcribe_stream(
+    blocks,
+    model,
+    *,
+    samplerate: int,
+    target_sr: int,
+    use_denoise: bool = False,
+):
+    '''
+    Streaming processing pipeline:
+    block preprocess -> optional bandpass -> int16 bytes -> Vosk, result is yielded as soon as Vosk emits it.
+    Blocks are read on a separate thread, so audio waiting while Vosk decodes is stamped on arrival
+    and decoding backlog is included in latency.
+
+    blocks:
+        iterable of (int16 frames (N, C), arrival time (time.monotonic())),
+        ending with an empty block stamped at end of stream (see iter_pcm_blocks())
+
+    Yields:
+        event dicts: type, text, wall clock time, audio position (s) and latency from audio arrival (ms)
+    '''
+    preprocessor = StreamPreprocessor(samplerate, target_sr, use_bandpass=use_denoise)
+    byte_blocks = ((preprocessor.process(frames), arrival) for frames, arrival in threaded_blocks(blocks))
+
+    for kind, result, arrival in stream_int16_results(model, byte_blocks, target_sr):
+        latency_ms = (time.monotonic() - arrival) * 1000.0 if arrival is not None else None
 
-    return transcribe_int16_wav(model, int16_bytes, samplerate)
\ No newline at end of file
+        yield {
+            'type': kind,
+            'text': result.get('partial', result.get('text', '')).strip(),
+            'time': round(time.time(), 3),
+            'audio_s': round(preprocessor.audio_seconds, 3),
+            'latency_ms': round(latency_ms, 1) if latency_ms is not None else None,
+        }